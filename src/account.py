@@ -3,6 +3,7 @@
 from pathlib import Path
 from typing import Callable
 
+import numpy as np
 import pandas as pd
 
 
@@ -22,7 +23,7 @@ class Account:
         Args:
             name: Account name
             date_normalizer: Function to normalize date column
-            amount_normalizer: Function to normalize amount column
+            amount_normalizer: Function to normalize amount column to integer cents
             description_normalizer: Function to normalize description column
             header_val: Row number to use as header when reading CSV (default 0, can be None)
         """
@@ -45,7 +46,11 @@ class Account:
         """
 
         self.source_transactions = pd.concat(
-            [self.source_transactions, pd.read_csv(csv_path, header=self.header_val)],
+            [
+                self.source_transactions,
+                # Read as text so amounts reach the normalizers without float rounding
+                pd.read_csv(csv_path, header=self.header_val, dtype=str),
+            ],
             ignore_index=True,
         )
 
@@ -61,3 +66,54 @@ class Account:
             amount=self.amount_normalizer(self.source_transactions),
             description=self.description_normalizer(self.source_transactions),
         ).loc[:, ["account", "date", "amount", "description"]]
+
+    @staticmethod
+    def to_cents(values: pd.Series) -> pd.Series:
+        """Parse a column of currency amounts into exact integer cents.
+
+        Text is parsed directly (ignoring '$', '+', ',' and whitespace) so no
+        float rounding is introduced. Missing values become zero cents, and
+        amounts with more than two decimals are rounded to the cent.
+
+        Args:
+            values: Series of amount strings or numbers (e.g., "+$1,234.56")
+
+        Returns:
+            Series of int64 cents aligned with the input index
+
+        Raises:
+            ValueError: If a value cannot be parsed as a currency amount
+        """
+
+        if pd.api.types.is_numeric_dtype(values):
+            return values.fillna(0).mul(100).round().astype("int64")
+
+        text = values.astype("string").str.replace(r"[\+\$,\s]", "", regex=True)
+        parts = text.str.extract(r"^(-?)(\d*)\.?(\d*)$")
+
+        # A bare sign or decimal point has no digits to parse
+        invalid = (
+            parts[1].isna() | (parts[1].eq("") & parts[2].eq(""))
+        ) & text.fillna("").ne("")
+        if invalid.any():
+            raise ValueError(
+                f"unparseable amount(s): {values[invalid].unique().tolist()[:5]}"
+            )
+
+        # Round extra fraction digits the way format(x, ".2f") did, so book
+        # keys written before amounts were kept in cents still match
+        extra = parts[2].str.len().gt(2).fillna(False)
+        if extra.any():
+            rounded = text[extra].map(
+                lambda amount: format(abs(float(amount)), ".2f")
+            ).str.split(".", expand=True)
+            parts.loc[extra, 1] = rounded[0]
+            parts.loc[extra, 2] = rounded[1]
+
+        sign = np.where(parts[0].fillna("").eq("-"), -1, 1)
+        whole = parts[1].fillna("").replace("", "0").astype("int64")
+        fraction = parts[2].fillna("").str.ljust(2, "0").astype("int64")
+
+        return pd.Series(sign * (whole * 100 + fraction), index=values.index).astype(
+            "int64"
+        )
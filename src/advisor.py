@@ -8,7 +8,11 @@ import pandas as pd
 from tabulate import tabulate
 
 from account_adapters import ACCOUNT_ADAPTERS
+from backup import BookBackup
 from banker import Banker
+from recurring import RecurringDetector
+from snapshot import Snapshot
+from suggester import TagSuggester
 from transaction import Transaction
 
 
@@ -21,6 +25,7 @@ class Advisor:
         """Initialize the advisor with supported bank accounts and tagging system."""
 
         self.banker: Banker = Banker(*ACCOUNT_ADAPTERS)
+        self.book_backup: BookBackup = BookBackup()
 
     def advise(self) -> None:
         """Load transactions, apply tags, and generate organized transaction reports.
@@ -28,8 +33,11 @@ class Advisor:
         Provides an interactive menu for viewing and tagging transactions.
         """
 
-        # Direct the banker to load transactions for the provided accounts
-        self.banker.load_account_transactions(self.SOURCE_TRANSACTIONS_PATH)
+        # Start from the snapshot when it is current, otherwise load the sources
+        if not self.banker.load_snapshot(
+            Snapshot.SNAPSHOT_PATH, self.SOURCE_TRANSACTIONS_PATH
+        ):
+            self.banker.load_account_transactions(self.SOURCE_TRANSACTIONS_PATH)
 
         COMMANDS: Dict[str, Callable] = {"tag": self.tag}
         focused_transactions: List[Transaction] = []
@@ -56,7 +64,7 @@ class Advisor:
             focused_transactions_tabulated: List[Tuple[str, str, str, str, str]] = [
                 transaction.for_tabulate() for transaction in focused_transactions
             ]
-            focused_total: float = sum(
+            focused_total: int = sum(
                 transaction.amount for transaction in focused_transactions
             )
             print(
@@ -67,7 +75,7 @@ class Advisor:
                             (
                                 '',
                                 '',
-                                f'= {"+" if focused_total > 0 else "-"}${abs(focused_total):,.2f}',
+                                f'= {Transaction.format_cents(focused_total)}',
                                 '',
                                 '',
                             )
@@ -78,13 +86,72 @@ class Advisor:
                 }"
             )
 
+    def recurring(self) -> None:
+        """Load all transactions and display detected recurring transactions."""
+
+        if not self.banker.load_snapshot(
+            Snapshot.SNAPSHOT_PATH, self.SOURCE_TRANSACTIONS_PATH
+        ):
+            self.banker.load_account_transactions(self.SOURCE_TRANSACTIONS_PATH)
+
+        recurring_transactions: pd.DataFrame = RecurringDetector.detect(
+            self.banker.consolidate_transactions()
+        )
+        if recurring_transactions.empty:
+            print("\nno recurring transactions found")
+            return
+
+        print(
+            f"\n{
+                tabulate(
+                    [
+                        (
+                            row.merchant,
+                            row.account,
+                            row.period,
+                            row.occurrences,
+                            Transaction.format_cents(row.typical_amount),
+                            Transaction.format_cents(row.last_amount),
+                            pd.Timestamp(row.first_date).strftime('%B %d, %Y'),
+                            pd.Timestamp(row.last_date).strftime('%B %d, %Y'),
+                            row.status,
+                        )
+                        for row in recurring_transactions.itertuples(index=False)
+                    ],
+                    headers=[
+                        'merchant',
+                        'account',
+                        'period',
+                        'count',
+                        'typical',
+                        'last',
+                        'since',
+                        'latest',
+                        'status',
+                    ],
+                    tablefmt='fancy_grid',
+                )
+            }"
+        )
+
+    def snapshot(self) -> None:
+        """Load all source transactions and write them to a snapshot for fast startup."""
+
+        self.banker.load_account_transactions(self.SOURCE_TRANSACTIONS_PATH)
+        self.banker.write_snapshot(
+            Snapshot.SNAPSHOT_PATH, self.SOURCE_TRANSACTIONS_PATH
+        )
+
     def tag(self, transactions: List[Transaction]) -> None:
         """Interactively tag untagged transactions.
 
-        Displays each untagged transaction and prompts the user to enter
-        comma-separated tags. Exits when user provides empty input.
+        Displays each untagged transaction with numbered tag suggestions and
+        prompts the user to enter comma-separated tags, or a suggestion's
+        number to accept it. Exits when user provides empty input, then
+        backs up the book in the background.
         """
 
+        tag_suggester: TagSuggester = self.banker.get_tag_suggester()
         for transaction in reversed(transactions):
             # Skip already tagged transactions
             if transaction.tags:
@@ -100,31 +167,54 @@ class Advisor:
                 }"
             )
 
+            # Offer tag sets previously used for this merchant
+            suggestions: List[List[str]] = tag_suggester.suggest(
+                transaction.get_description()
+            )
+            for number, suggestion in enumerate(suggestions, start=1):
+                print(f"{number}) {', '.join(suggestion)}")
+
             # Tags are reqiured, if empty then exit tagging
             tags_input: str = input("enter tag(s): ").strip()
             if not tags_input:
-                return
-            tags: List[str] = [tag.strip() for tag in tags_input.split(",")]
+                break
+            tags: List[str] = (
+                suggestions[int(tags_input) - 1]
+                if tags_input.isdigit() and 0 < int(tags_input) <= len(suggestions)
+                else [tag.strip() for tag in tags_input.split(",")]
+            )
 
             self.banker.write_book(transaction, tags)
+        else:
+            # No more transactions to tag
+            print("tagging completed for query")
 
-        # No more transactions to tag
-        print("tagging completed for query")
+        # Snapshot the session's tags without blocking the prompt
+        if self.banker.BOOK_PATH.exists():
+            self.book_backup.backup_in_background()
 
     def filter(self, filter_line: str) -> List[Transaction]:
-        """Display filtered transactions based on user input."""
+        """Display filtered transactions based on user input.
+
+        Transfers between accounts are excluded so they aren't counted twice,
+        except when filtering on a single account or on "transfers" itself.
+        """
 
         predicates: List[Callable[[Transaction], bool]] = []
-        if filter_line == "all":
-            # no filter
-            predicates = [lambda transaction: True]
+        if filter_line == "transfers":
+            # filter on transfers between accounts
+            predicates = [lambda transaction: transaction.is_transfer()]
+        elif filter_line == "all":
+            # no filter beyond excluding transfers
+            predicates = [lambda transaction: not transaction.is_transfer()]
         elif bool(re.match(r"^(0[1-9]|1[0-2])\d{2}$", filter_line)):
             # filter on a month/year
             month: int = int(filter_line[:2])
             year: int = int(f"20{filter_line[2:]}")
             predicates = [
                 lambda t: pd.to_datetime(t.date).month == month
-                and pd.to_datetime(t.date).year == year
+                and pd.to_datetime(t.date).year == year,
+                lambda transaction: not transaction.is_transfer(),
             ]
         elif filter_line in self.banker.accounts.keys():
             # filter on bank account
@@ -136,14 +226,16 @@ class Advisor:
         elif filter_line in self.banker.get_all_tags():
             # filter on tag
             predicates = [
-                lambda transaction: (filter_line in getattr(transaction, "tags", []))
+                lambda transaction: (filter_line in getattr(transaction, "tags", [])),
+                lambda transaction: not transaction.is_transfer(),
             ]
         else:
             # filter on description
             predicates = [
                 lambda transaction: (
                     filter_line in getattr(transaction, "description").lower()
-                )
+                ),
+                lambda transaction: not transaction.is_transfer(),
             ]
 
         filtered_transactions: List[Transaction] = self.banker.filter_transactions(
@@ -0,0 +1,283 @@
+"""Versioned, content-addressed and compressed backups of the book."""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+from banker import Banker
+
+try:
+    import zstandard
+except ImportError:  # zstd is optional, gzip is always available
+    zstandard = None
+
+
+class BookBackup:
+    """Stores snapshots of book.json as full copies or journal deltas.
+
+    Every version is identified by the SHA-256 of the book contents. A full
+    snapshot is written every `full_every` versions and the versions between
+    them only store the tags that changed, so frequent backups stay small.
+    Full snapshots are content-addressed; deltas are addressed by their own
+    and their parent's hash, since their contents depend on both.
+    """
+
+    BACKUP_PATH: Path = Path("backups")
+    MANIFEST_NAME: str = "manifest.json"
+
+    def __init__(
+        self,
+        backup_path: Path = BACKUP_PATH,
+        book_path: Path = Banker.BOOK_PATH,
+        full_every: int = 10,
+        retain: int = 5,
+    ) -> None:
+        """Initialize the backup engine for a backup directory.
+
+        Args:
+            backup_path: Directory holding the manifest and snapshot objects
+            book_path: Path to the book to back up
+            full_every: Number of versions per full snapshot (deltas in between)
+            retain: Number of full snapshots (with their deltas) to keep when pruning
+        """
+        self.backup_path: Path = backup_path
+        self.book_path: Path = book_path
+        self.full_every: int = max(1, full_every)
+        self.retain: int = max(1, retain)
+
+        self.extension: str = ".zst" if zstandard else ".gz"
+        self.lock: threading.Lock = threading.Lock()
+
+    def backup(self) -> str | None:
+        """Snapshot the book if it changed since the latest version.
+
+        Returns:
+            Hash of the new version, or None if the book was unchanged
+
+        Raises:
+            FileNotFoundError: If the book doesn't exist
+            ValueError: If the book is empty or not valid JSON
+        """
+
+        with self.lock:
+            if not self.book_path.exists():
+                raise FileNotFoundError(
+                    f"book not found at: {self.book_path.absolute()}"
+                )
+
+            book_bytes: bytes = self.book_path.read_bytes()
+            book_hash: str = hashlib.sha256(book_bytes).hexdigest()
+
+            # Skip unchanged books
+            versions: List[Dict[str, Any]] = self.read_manifest()
+            if versions and versions[-1]["hash"] == book_hash:
+                return None
+
+            # Never record an empty or partially written book as a version
+            try:
+                book: Dict[str, List[str]] = json.loads(book_bytes)
+            except ValueError:
+                raise ValueError(
+                    f"book is empty or unreadable at: {self.book_path.absolute()}"
+                ) from None
+            if not isinstance(book, dict):
+                raise ValueError(
+                    f"book is not a mapping of tags at: {self.book_path.absolute()}"
+                )
+
+            # Store a delta against the previous version until a full snapshot is due
+            since_full: int = next(
+                (
+                    i
+                    for i, version in enumerate(reversed(versions))
+                    if version["kind"] == "full"
+                ),
+                len(versions),
+            )
+            if versions and since_full + 1 < self.full_every:
+                previous: Dict[str, List[str]] = self.restore(versions[-1]["hash"])
+                kind: str = "delta"
+                payload: Dict[str, Any] = {
+                    "set": {
+                        key: tags
+                        for key, tags in book.items()
+                        if previous.get(key) != tags
+                    },
+                    "removed": [key for key in previous if key not in book],
+                }
+            else:
+                kind = "full"
+                payload = book
+
+            version: Dict[str, Any] = {
+                "hash": book_hash,
+                "kind": kind,
+                "created": datetime.now().isoformat(timespec="seconds"),
+            }
+            if kind == "delta":
+                version["parent"] = versions[-1]["hash"]
+            self.write_object(version, payload)
+            versions.append(version)
+            self.write_manifest(versions)
+            self.prune(versions)
+
+            return book_hash
+
+    def backup_in_background(self) -> threading.Thread:
+        """Run a backup on a background thread so the caller isn't blocked.
+
+        The thread is not a daemon, so an in-flight backup finishes before exit.
+
+        Returns:
+            The started thread
+        """
+
+        def run() -> None:
+            try:
+                self.backup()
+            except Exception as e:
+                print(f"\nbackground backup failed: {str(e).lower()}")
+
+        thread = threading.Thread(target=run, name="book-backup")
+        thread.start()
+        return thread
+
+    def restore(self, book_hash: str | None = None) -> Dict[str, List[str]]:
+        """Rebuild a book version from its full snapshot and following deltas.
+
+        Args:
+            book_hash: Version to rebuild (default latest)
+
+        Returns:
+            Dictionary mapping transaction hashes to lists of tag strings
+
+        Raises:
+            KeyError: If the version is not in the manifest
+        """
+
+        versions: List[Dict[str, Any]] = self.read_manifest()
+        if not versions:
+            raise KeyError("no backups found")
+        # A book can return to an earlier state, so target its latest occurrence
+        matches: List[int] = [
+            i
+            for i, version in enumerate(versions)
+            if book_hash is None or version["hash"] == book_hash
+        ]
+        if not matches:
+            raise KeyError(f"no backup for version: {book_hash}")
+        target: int = matches[-1]
+
+        # Walk back to the nearest full snapshot, then replay deltas forward
+        start: int = target
+        while versions[start]["kind"] != "full":
+            start -= 1
+
+        book: Dict[str, List[str]] = self.read_object(versions[start])
+        for version in versions[start + 1 : target + 1]:
+            delta: Dict[str, Any] = self.read_object(version)
+            book.update(delta["set"])
+            for key in delta["removed"]:
+                book.pop(key, None)
+
+        return book
+
+    def prune(self, versions: List[Dict[str, Any]]) -> None:
+        """Drop versions older than the retained full snapshots.
+
+        Args:
+            versions: Current manifest entries, oldest first
+        """
+
+        full_indices: List[int] = [
+            i for i, version in enumerate(versions) if version["kind"] == "full"
+        ]
+        if len(full_indices) <= self.retain:
+            return
+
+        cutoff: int = full_indices[-self.retain]
+        kept: List[Dict[str, Any]] = versions[cutoff:]
+        kept_objects: set[str] = {self.object_stem(version) for version in kept}
+        for version in versions[:cutoff]:
+            if self.object_stem(version) not in kept_objects:
+                self.object_path(version).unlink(missing_ok=True)
+
+        self.write_manifest(kept)
+
+    def read_manifest(self) -> List[Dict[str, Any]]:
+        """Read the list of stored versions, oldest first."""
+
+        try:
+            with open(self.backup_path / self.MANIFEST_NAME, "r") as manifest_file:
+                return json.load(manifest_file)
+        except FileNotFoundError:
+            return []
+
+    def write_manifest(self, versions: List[Dict[str, Any]]) -> None:
+        """Atomically replace the manifest with the provided versions."""
+
+        self.write_atomic(
+            self.backup_path / self.MANIFEST_NAME,
+            json.dumps(versions, indent=2).encode(),
+        )
+
+    @staticmethod
+    def object_stem(version: Dict[str, Any]) -> str:
+        """Get the file name, without codec extension, of a version's object."""
+
+        if version["kind"] == "delta":
+            return f"{version['hash']}.{version['parent']}.delta"
+
+        return f"{version['hash']}.full"
+
+    def object_path(self, version: Dict[str, Any]) -> Path:
+        """Get the path of a version's snapshot object."""
+
+        stem: str = self.object_stem(version)
+
+        # Reuse whichever codec wrote an existing object
+        for extension in (".zst", ".gz"):
+            path: Path = self.backup_path / "objects" / f"{stem}{extension}"
+            if path.exists():
+                return path
+
+        return self.backup_path / "objects" / f"{stem}{self.extension}"
+
+    def write_object(self, version: Dict[str, Any], payload: Dict[str, Any]) -> None:
+        """Compress and store a version's snapshot object."""
+
+        data: bytes = json.dumps(payload, separators=(",", ":")).encode()
+        if zstandard:
+            data = zstandard.ZstdCompressor().compress(data)
+        else:
+            data = gzip.compress(data)
+
+        self.write_atomic(self.object_path(version), data)
+
+    def read_object(self, version: Dict[str, Any]) -> Dict[str, Any]:
+        """Load and decompress a version's snapshot object."""
+
+        path: Path = self.object_path(version)
+        data: bytes = path.read_bytes()
+        if path.suffix == ".zst":
+            if not zstandard:
+                raise RuntimeError(f"zstandard is required to read: {path}")
+            data = zstandard.ZstdDecompressor().decompress(data)
+        else:
+            data = gzip.decompress(data)
+
+        return json.loads(data)
+
+    @staticmethod
+    def write_atomic(path: Path, data: bytes) -> None:
+        """Write a file via a temporary sibling so readers never see partial data."""
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path: Path = path.with_name(f".{path.name}.tmp")
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
@@ -1,6 +1,7 @@
 """Manages multiple bank accounts and provides transaction operations."""
 
 import json
+import os
 from pathlib import Path
 from typing import Callable, Dict, Iterator, List
 
@@ -8,7 +9,10 @@ import numpy as np
 import pandas as pd
 
 from account import Account
+from snapshot import Snapshot
+from suggester import TagSuggester
 from transaction import Transaction
+from transfers import TransferMatcher
 
 
 class Banker:
@@ -22,6 +26,7 @@ class Banker:
             account.name.lower(): account for account in adapters
         }
         self.transactions: pd.DataFrame
+        self.tag_suggester: TagSuggester | None = None  # built on first use
 
     def load_account_transactions(self, source_transactions_path: Path) -> None:
         """Load and normalize transactions from source CSV files for all accounts.
@@ -50,11 +55,124 @@ class Banker:
         for account in self.accounts.values():
             account.normalize_source_transactions()
 
+        self.match_transfers()
+        self.report_loaded(
+            np.mean([1 if len(transaction.tags) > 0 else 0 for transaction in self])
+        )
+
+    def load_snapshot(
+        self, snapshot_path: Path, source_transactions_path: Path
+    ) -> bool:
+        """Load normalized transactions from a snapshot if it matches the sources.
+
+        Args:
+            snapshot_path: Path to the snapshot file.
+            source_transactions_path: Path to directory containing CSV transaction files.
+
+        Returns:
+            True if the snapshot was loaded, False if a full load is required.
+        """
+
+        snapshot: Snapshot | None = Snapshot.open(
+            snapshot_path, Snapshot.source_fingerprint(source_transactions_path)
+        )
+        if snapshot is None:
+            return False
+
+        # Hand each account its row range of the snapshot
+        account_frames: Dict[str, pd.DataFrame] = snapshot.account_frames()
+        for account in self.accounts.values():
+            account.transactions = account_frames.get(account.name, pd.DataFrame())
+
+        # Remove accounts without transactions
+        self.accounts = {
+            name: account
+            for name, account in self.accounts.items()
+            if len(account.transactions)
+        }
+
+        self.match_transfers()
+
+        # Tags may have changed since the snapshot, so resolve them from the book
+        book: Dict[str, List[str]] = self.read_book()
+        self.report_loaded(
+            np.mean([bool(book.get(key)) for key in snapshot.strings("book_key")])
+        )
+
+        return True
+
+    def write_snapshot(
+        self, snapshot_path: Path, source_transactions_path: Path
+    ) -> None:
+        """Write the loaded transactions and their book keys to a snapshot file.
+
+        Args:
+            snapshot_path: Destination path for the snapshot file.
+            source_transactions_path: Path to directory the transactions were loaded from.
+        """
+
+        transactions: pd.DataFrame = self.consolidate_transactions()
+        book_keys: List[str] = [
+            Transaction(transaction_df).hash()
+            for transaction_df in transactions.itertuples(index=False)
+        ]
+
+        Snapshot.write(
+            snapshot_path,
+            transactions,
+            book_keys,
+            Snapshot.source_fingerprint(source_transactions_path),
+        )
+        print(
+            f"\nsnapshot of {len(transactions):,} transactions written to {snapshot_path}"
+        )
+
+    def consolidate_transactions(self) -> pd.DataFrame:
+        """Combine the normalized transactions of all accounts into one frame.
+
+        Returns:
+            DataFrame with account, date, amount (cents) and description columns,
+            plus transfer_id once transfers have been matched.
+        """
+
+        return pd.concat(
+            [account.transactions for account in self.accounts.values()],
+            ignore_index=True,
+        )
+
+    def match_transfers(self) -> None:
+        """Mark transfers between accounts with a shared transfer id per pair.
+
+        Adds a transfer_id column to each account's transactions, -1 for
+        transactions that aren't part of a transfer.
+        """
+
+        if not self.accounts:
+            return
+
+        transfer_ids = TransferMatcher.match(self.consolidate_transactions())
+
+        # Consolidated rows are in account order, so split the ids back out
+        offset: int = 0
+        for account in self.accounts.values():
+            account.transactions = account.transactions.assign(
+                transfer_id=transfer_ids[offset : offset + len(account.transactions)]
+            )
+            offset += len(account.transactions)
+
+    def report_loaded(self, tagged_fraction: float) -> None:
+        """Print a summary of the loaded accounts and transactions.
+
+        Args:
+            tagged_fraction: Fraction of transactions that have tags.
+        """
+
         print(
             "\n"
             f"loaded {len(self.accounts)} accounts with "
             f"{sum([len(account.transactions) for account in self.accounts.values()]):,} total transactions, "
-            f"{int(np.mean([1 if len(transaction.tags) > 0 else 0 for transaction in self]) * 100)}% tagged"
+            f"{int(tagged_fraction * 100)}% tagged, "
+            f"{sum([int((account.transactions['transfer_id'] >= 0).sum()) for account in self.accounts.values()]) // 2:,} transfers matched"
         )
 
     def filter_transactions(
@@ -111,9 +229,28 @@ class Banker:
         # Update transaction tags from hash
         book.setdefault(transaction.hash(), []).extend(tags)
 
-        # Perform file write
-        with open(self.BOOK_PATH, "w") as book_file:
+        # Write via a temporary sibling so readers (e.g. a background backup)
+        # never see a partially written book
+        temp_path: Path = self.BOOK_PATH.with_name(f".{self.BOOK_PATH.name}.tmp")
+        with open(temp_path, "w") as book_file:
             json.dump(book, book_file, indent=2)
+        os.replace(temp_path, self.BOOK_PATH)
+
+        # Keep tag suggestions current without rebuilding the index
+        if self.tag_suggester is not None:
+            self.tag_suggester.add(transaction.get_description(), tags)
+
+    def get_tag_suggester(self) -> TagSuggester:
+        """Get the tag suggester, building it from the book on first use.
+
+        Returns:
+            Tag suggester indexing the book's tagging history.
+        """
+
+        if self.tag_suggester is None:
+            self.tag_suggester = TagSuggester(self.read_book())
+
+        return self.tag_suggester
 
     def read_book(self) -> Dict[str, List[str]]:
         """Read the book (transaction tags) from persistent storage.
@@ -15,6 +15,18 @@ if __name__ == "__main__":
     )
     advise_parser.set_defaults(func=lambda args: Advisor().advise())
 
+    # Subcommand: recurring
+    recurring_parser = subparsers.add_parser(
+        "recurring", help="detect subscriptions and other recurring transactions"
+    )
+    recurring_parser.set_defaults(func=lambda args: Advisor().recurring())
+
+    # Subcommand: snapshot
+    snapshot_parser = subparsers.add_parser(
+        "snapshot", help="write a binary snapshot of all transactions for fast startup"
+    )
+    snapshot_parser.set_defaults(func=lambda args: Advisor().snapshot())
+
     # Let each class register its own subparser
     Utilities.register_parser(subparsers)
 
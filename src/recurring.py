@@ -0,0 +1,215 @@
+"""Detection of recurring transactions such as subscriptions, rent and payroll."""
+
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from suggester import TagSuggester
+
+
+class RecurringDetector:
+    """Finds recurring transactions using vectorized interval statistics.
+
+    Transactions are grouped by merchant key and direction (money in or out),
+    sorted by date once, and each group's interval and amount statistics are
+    computed from array differences instead of pairwise comparisons.
+    """
+
+    PERIODS: Dict[str, float] = {
+        "weekly": 7.0,
+        "biweekly": 14.0,
+        "monthly": 30.44,
+        "quarterly": 91.31,
+        "yearly": 365.25,
+    }
+    PERIOD_TOLERANCE: float = 0.2  # allowed relative deviation of an interval
+    MIN_REGULARITY: float = 0.75  # share of intervals that must fit the period
+    AMOUNT_TOLERANCE: float = 0.2  # allowed relative deviation of amounts
+    MIN_OCCURRENCES: int = 3
+    NEW_PERIODS: float = 4.0  # periods since the first occurrence to count as new
+    NEW_DAYS: int = 90  # and at most this many days, so long periods never look new
+    STOPPED_PERIODS: float = 2.0  # missed periods before counting as stopped
+
+    @classmethod
+    def detect(
+        cls, transactions: pd.DataFrame, as_of: pd.Timestamp | None = None
+    ) -> pd.DataFrame:
+        """Detect recurring transactions in a normalized transaction frame.
+
+        Args:
+            transactions: Normalized frame with account, date, amount (cents)
+                and description columns, as produced by
+                Account.normalize_source_transactions
+            as_of: Date to judge stopped subscriptions against (default latest
+                transaction date)
+
+        Returns:
+            One row per recurring merchant with merchant, account, period,
+            occurrences, typical and last amounts (cents), first and last
+            dates, and status ("active", "new", "price changed" or "stopped"),
+            sorted by merchant
+        """
+
+        columns = [
+            "merchant",
+            "account",
+            "period",
+            "occurrences",
+            "typical_amount",
+            "last_amount",
+            "first_date",
+            "last_date",
+            "status",
+        ]
+        # Normalize each distinct description once, then broadcast to rows
+        codes, descriptions = pd.factorize(transactions["description"].astype(str))
+        merchant_keys: np.ndarray = np.array(
+            [TagSuggester.merchant_key(description) for description in descriptions],
+            dtype=object,
+        )
+        merchants: np.ndarray = merchant_keys[codes]
+        amounts: np.ndarray = transactions["amount"].to_numpy(dtype=np.int64)
+        days: np.ndarray = (
+            transactions["date"].to_numpy(dtype="datetime64[D]").astype(np.int64)
+        )
+        accounts: np.ndarray = transactions["account"].to_numpy(dtype=object)
+
+        keep: np.ndarray = merchants != ""
+        merchants, amounts, days, accounts = (
+            merchants[keep],
+            amounts[keep],
+            days[keep],
+            accounts[keep],
+        )
+        if not len(merchants):
+            return pd.DataFrame(columns=columns)
+
+        # Sort once by (group, date) so each group is a contiguous run
+        group_ids: np.ndarray = (
+            pd.DataFrame({"merchant": merchants, "direction": np.sign(amounts)})
+            .groupby(["merchant", "direction"], sort=False)
+            .ngroup()
+            .to_numpy()
+        )
+        order: np.ndarray = np.lexsort((days, group_ids))
+        group_ids, merchants, amounts, days, accounts = (
+            group_ids[order],
+            merchants[order],
+            amounts[order],
+            days[order],
+            accounts[order],
+        )
+        starts: np.ndarray = np.flatnonzero(
+            np.r_[True, group_ids[1:] != group_ids[:-1]]
+        )
+        ends: np.ndarray = np.r_[starts[1:], len(group_ids)] - 1
+        occurrences: np.ndarray = ends - starts + 1
+
+        # Intervals between consecutive occurrences within each group
+        same_group: np.ndarray = group_ids[1:] == group_ids[:-1]
+        intervals: np.ndarray = np.diff(days)[same_group].astype(float)
+        interval_groups: np.ndarray = group_ids[1:][same_group]
+        median_intervals: np.ndarray = (
+            pd.Series(intervals)
+            .groupby(interval_groups)
+            .median()
+            .reindex(group_ids[starts], fill_value=np.nan)
+            .to_numpy()
+        )
+
+        # Match each group's median interval to the nearest known period
+        period_lengths: np.ndarray = np.array(list(cls.PERIODS.values()))
+        period_labels: np.ndarray = np.array(list(cls.PERIODS.keys()), dtype=object)
+        deviations: np.ndarray = (
+            np.abs(median_intervals[:, None] - period_lengths[None, :])
+            / period_lengths[None, :]
+        )
+        nearest: np.ndarray = np.argmin(
+            np.where(np.isnan(deviations), np.inf, deviations), axis=1
+        )
+        periodic: np.ndarray = (
+            deviations[np.arange(len(starts)), nearest] <= cls.PERIOD_TOLERANCE
+        )
+        group_periods: np.ndarray = period_lengths[nearest]
+
+        # Share of intervals that fit the matched period
+        interval_periods: np.ndarray = group_periods[
+            np.searchsorted(group_ids[starts], interval_groups)
+        ]
+        regularity: np.ndarray = (
+            pd.Series(
+                np.abs(intervals - interval_periods) / interval_periods
+                <= cls.PERIOD_TOLERANCE
+            )
+            .groupby(interval_groups)
+            .mean()
+            .reindex(group_ids[starts], fill_value=0.0)
+            .to_numpy()
+        )
+
+        # Amount stability as median absolute deviation relative to the median
+        row_groups: np.ndarray = np.repeat(np.arange(len(starts)), occurrences)
+        magnitudes: pd.Series = pd.Series(np.abs(amounts))
+        median_amounts: np.ndarray = magnitudes.groupby(row_groups).median().to_numpy()
+        amount_deviation: np.ndarray = (
+            magnitudes - median_amounts[row_groups]
+        ).abs().groupby(row_groups).median().to_numpy() / np.maximum(median_amounts, 1)
+
+        recurring: np.ndarray = (
+            (occurrences >= cls.MIN_OCCURRENCES)
+            & periodic
+            & (regularity >= cls.MIN_REGULARITY)
+            & (amount_deviation <= cls.AMOUNT_TOLERANCE)
+        )
+
+        # Flag stopped, new and price-changed subscriptions
+        as_of_day: int = (
+            int(days.max())
+            if as_of is None
+            else int(
+                pd.Timestamp(as_of)
+                .to_datetime64()
+                .astype("datetime64[D]")
+                .astype(np.int64)
+            )
+        )
+        last_amounts: np.ndarray = amounts[ends]
+        typical_amounts: np.ndarray = np.sign(last_amounts) * np.round(
+            median_amounts
+        ).astype(np.int64)
+        previous_amounts: np.ndarray = amounts[np.maximum(ends - 1, starts)]
+        earlier_amounts: np.ndarray = amounts[np.maximum(ends - 2, starts)]
+        status: np.ndarray = np.select(
+            [
+                as_of_day - days[ends] > cls.STOPPED_PERIODS * group_periods,
+                as_of_day - days[starts]
+                <= np.minimum(cls.NEW_PERIODS * group_periods, cls.NEW_DAYS),
+                # A new amount after a stable run, or one that has since repeated
+                (last_amounts != typical_amounts)
+                & (
+                    (previous_amounts == earlier_amounts)
+                    | (last_amounts == previous_amounts)
+                ),
+            ],
+            ["stopped", "new", "price changed"],
+            default="active",
+        )
+
+        return (
+            pd.DataFrame(
+                {
+                    "merchant": merchants[starts],
+                    "account": accounts[ends],
+                    "period": period_labels[nearest],
+                    "occurrences": occurrences,
+                    "typical_amount": typical_amounts,
+                    "last_amount": last_amounts,
+                    "first_date": days[starts].astype("datetime64[D]"),
+                    "last_date": days[ends].astype("datetime64[D]"),
+                    "status": status,
+                }
+            )[recurring]
+            .sort_values("merchant", kind="stable")
+            .reset_index(drop=True)
+        )
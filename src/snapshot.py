@@ -0,0 +1,247 @@
+"""Memory-mapped binary snapshot of the normalized session for fast startup."""
+
+import hashlib
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class Snapshot:
+    """Single-file columnar snapshot of normalized transactions and their book keys.
+
+    The file holds a magic marker, a JSON header describing each section,
+    then 64-byte aligned sections: fixed-width NumPy columns (date, amount in
+    cents) and NUL-separated UTF-8 string columns (description, book key).
+    Rows are grouped by account, and the header records each account's row
+    range. Tags are not stored; they are resolved against the live book
+    through the book keys. Opening maps the file and exposes the numeric
+    columns as zero-copy arrays, and account frames are built from slices of
+    them without copying.
+    """
+
+    SNAPSHOT_PATH: Path = Path("snapshot.bin")
+    MAGIC: bytes = b"MONEYSN2"
+    ALIGNMENT: int = 64
+    ROW_SEPARATOR: str = "\x00"
+
+    def __init__(self, snapshot_file: mmap.mmap, header: Dict[str, Any]) -> None:
+        """Expose the sections of a mapped snapshot file.
+
+        Args:
+            snapshot_file: Read-only memory map of the snapshot file
+            header: Parsed header describing the file's sections
+        """
+        self.snapshot_file: mmap.mmap = snapshot_file
+        self.fingerprint: str = header["fingerprint"]
+        self.accounts: Dict[str, Tuple[int, int]] = {
+            name: (start, stop) for name, (start, stop) in header["accounts"].items()
+        }
+        self.rows: int = header["rows"]
+
+        # Sections must lie within the file; np.frombuffer checks the columns
+        for section in header["strings"].values():
+            if section["offset"] + section["nbytes"] > len(snapshot_file):
+                raise ValueError("string section extends past end of snapshot")
+
+        self.columns: Dict[str, np.ndarray] = {
+            name: np.frombuffer(
+                snapshot_file,
+                dtype=section["dtype"],
+                count=self.rows,
+                offset=section["offset"],
+            )
+            for name, section in header["columns"].items()
+        }
+        self.string_sections: Dict[str, Dict[str, int]] = header["strings"]
+
+    @staticmethod
+    def source_fingerprint(source_path: Path) -> str:
+        """Fingerprint the source CSVs by path, size and modification time.
+
+        The book is deliberately excluded so tagging doesn't invalidate the
+        snapshot; tags are resolved against the live book via the book keys.
+
+        Args:
+            source_path: Directory containing source CSV files
+
+        Returns:
+            Hex digest that changes whenever any source file changes
+        """
+
+        digest = hashlib.sha256()
+        for path in sorted(source_path.rglob("*.csv")):
+            stat = path.stat()
+            digest.update(f"{path}|{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+
+        return digest.hexdigest()
+
+    @classmethod
+    def write(
+        cls,
+        snapshot_path: Path,
+        transactions: pd.DataFrame,
+        book_keys: List[str],
+        fingerprint: str,
+    ) -> None:
+        """Serialize normalized transactions and their book keys into one file.
+
+        Args:
+            snapshot_path: Destination path for the snapshot file
+            transactions: Normalized frame with account, date, amount and description
+            book_keys: Book key (Transaction.hash) for each row
+            fingerprint: Source fingerprint the snapshot was built from
+        """
+
+        # Group rows by account so each account is one contiguous row range
+        account_codes, account_names = pd.factorize(transactions["account"])
+        order: np.ndarray = np.argsort(account_codes, kind="stable")
+        transactions = transactions.iloc[order]
+        book_keys = [book_keys[i] for i in order]
+        bounds: np.ndarray = np.searchsorted(
+            account_codes[order], np.arange(len(account_names) + 1)
+        )
+        accounts: Dict[str, List[int]] = {
+            str(name): [int(bounds[code]), int(bounds[code + 1])]
+            for code, name in enumerate(account_names)
+        }
+
+        columns: Dict[str, np.ndarray] = {
+            "date": transactions["date"].to_numpy(dtype="datetime64[ns]").view("<i8"),
+            "amount": transactions["amount"].to_numpy(dtype="<i8"),
+        }
+        strings: Dict[str, bytes] = {
+            "description": cls.ROW_SEPARATOR.join(
+                transactions["description"].astype(str)
+            ).encode(),
+            "book_key": cls.ROW_SEPARATOR.join(book_keys).encode(),
+        }
+
+        # Lay out sections after the header, each aligned for direct mapping
+        sections: List[bytes] = [
+            *(column.tobytes() for column in columns.values()),
+            *strings.values(),
+        ]
+        header: Dict[str, Any] = {
+            "fingerprint": fingerprint,
+            "accounts": accounts,
+            "rows": len(transactions),
+            "columns": {
+                name: {"dtype": column.dtype.str} for name, column in columns.items()
+            },
+            "strings": {name: {} for name in strings},
+        }
+        section_headers: List[Dict[str, int]] = [
+            *header["columns"].values(),
+            *header["strings"].values(),
+        ]
+        header_size: int = 4096
+        while True:
+            offset: int = header_size
+            for section_header, section in zip(section_headers, sections):
+                section_header["offset"] = offset
+                section_header["nbytes"] = len(section)
+                offset += -(-len(section) // cls.ALIGNMENT) * cls.ALIGNMENT
+            header_bytes: bytes = json.dumps(header).encode()
+            if len(cls.MAGIC) + 8 + len(header_bytes) <= header_size:
+                break
+            header_size *= 2
+
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path: Path = snapshot_path.with_name(f".{snapshot_path.name}.tmp")
+        with open(temp_path, "wb") as snapshot_file:
+            snapshot_file.write(cls.MAGIC + struct.pack("<Q", len(header_bytes)))
+            snapshot_file.write(header_bytes)
+            for section_header, section in zip(section_headers, sections):
+                snapshot_file.seek(section_header["offset"])
+                snapshot_file.write(section)
+            snapshot_file.truncate(offset)
+        temp_path.replace(snapshot_path)
+
+    @classmethod
+    def open(cls, snapshot_path: Path, fingerprint: str) -> "Snapshot | None":
+        """Map a snapshot file if it exists and matches the current sources.
+
+        Args:
+            snapshot_path: Path to the snapshot file
+            fingerprint: Current source fingerprint
+
+        Returns:
+            The mapped snapshot, or None if missing, unreadable or stale
+        """
+
+        try:
+            with open(snapshot_path, "rb") as snapshot_file:
+                mapped = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            return None
+
+        # Malformed or old-format files fall back to a full load
+        magic_size: int = len(cls.MAGIC)
+        try:
+            if mapped[:magic_size] != cls.MAGIC:
+                return None
+            (header_length,) = struct.unpack_from("<Q", mapped, magic_size)
+            header: Dict[str, Any] = json.loads(
+                mapped[magic_size + 8 : magic_size + 8 + header_length]
+            )
+            if header["fingerprint"] != fingerprint:
+                return None
+
+            return cls(mapped, header)
+        except (struct.error, ValueError, KeyError, TypeError, AttributeError):
+            return None
+
+    def strings(self, name: str) -> List[str]:
+        """Decode a string column.
+
+        Args:
+            name: Either "description" or "book_key"
+
+        Returns:
+            One string per row
+        """
+
+        if not self.rows:
+            return []
+
+        section: Dict[str, int] = self.string_sections[name]
+        return (
+            self.snapshot_file[
+                section["offset"] : section["offset"] + section["nbytes"]
+            ]
+            .decode()
+            .split(self.ROW_SEPARATOR)
+        )
+
+    def account_frames(self) -> Dict[str, pd.DataFrame]:
+        """Build each account's normalized account/date/amount/description frame.
+
+        The date and amount columns are views of the mapped file rather than
+        copies; descriptions are decoded from UTF-8.
+
+        Returns:
+            Dictionary mapping account names to their transactions
+        """
+
+        descriptions: List[str] = self.strings("description")
+        dates: np.ndarray = self.columns["date"].view("datetime64[ns]")
+        amounts: np.ndarray = self.columns["amount"]
+
+        return {
+            name: pd.DataFrame(
+                {
+                    "account": name,
+                    "date": dates[start:stop],
+                    "amount": amounts[start:stop],
+                    "description": descriptions[start:stop],
+                },
+                index=pd.RangeIndex(stop - start),
+                copy=False,
+            )
+            for name, (start, stop) in self.accounts.items()
+        }
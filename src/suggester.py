@@ -0,0 +1,218 @@
+"""Merchant to tag index used to suggest tags while tagging."""
+
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+
+class TagSuggester:
+    """Suggests tag sets for a description from previously tagged merchants.
+
+    Descriptions are reduced to a merchant key of normalized tokens. Exact
+    merchant keys are looked up directly; anything else falls back to TF-IDF
+    weighted character trigram similarity against the known merchants.
+    """
+
+    NOISE_TOKENS: set[str] = {"pos", "purchase", "debit", "card", "ach", "www", "com"}
+    MERCHANT_TOKENS: int = 3
+    MIN_SIMILARITY: float = 0.5
+
+    def __init__(self, book: Dict[str, List[str]]) -> None:
+        """Build the index from the book's tagging history.
+
+        Args:
+            book: Dictionary mapping transaction hashes to lists of tag strings.
+        """
+
+        self.merchant_tags: Dict[str, Counter[Tuple[str, ...]]] = defaultdict(Counter)
+        self.merchant_trigrams: Dict[str, Counter[str]] = {}
+        self.trigram_merchants: Dict[str, set[str]] = defaultdict(set)
+
+        # Query-time caches built by the first refresh(); merchants added after
+        # that are appended to the postings without recomputing the IDF
+        self.idf: Dict[str, float] = {}
+        self.unseen_idf: float = 0.0
+        self.merchants: List[str] = []
+        self.postings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self.stale: bool = True
+
+        for transaction_hash, tags in book.items():
+            # Hashes end with " - <description>" (see Transaction.hash)
+            self.add(transaction_hash.partition(" - ")[2], tags)
+
+    @classmethod
+    def merchant_key(cls, description: str) -> str:
+        """Reduce a transaction description to a normalized merchant key.
+
+        Args:
+            description: Raw transaction description.
+
+        Returns:
+            Leading alphabetic tokens, lowercased with noise words removed, or
+            an empty string for missing (non-string) descriptions.
+        """
+
+        if not isinstance(description, str):
+            return ""
+
+        tokens: List[str] = [
+            token
+            for token in re.findall(r"[a-z]+", description.lower())
+            if len(token) > 2 and token not in cls.NOISE_TOKENS
+        ]
+
+        return " ".join(tokens[: cls.MERCHANT_TOKENS])
+
+    @staticmethod
+    def trigrams(merchant: str) -> Counter[str]:
+        """Count the character trigrams of a padded merchant key."""
+
+        padded: str = f"  {merchant} "
+        return Counter(padded[i : i + 3] for i in range(len(padded) - 2))
+
+    def add(self, description: str, tags: List[str]) -> None:
+        """Record tags for a description, updating the index incrementally.
+
+        Once the postings are built, a new merchant's postings are appended
+        using the current IDF values rather than rebuilding the index.
+
+        Args:
+            description: Raw transaction description.
+            tags: List of tag strings applied to the transaction.
+        """
+
+        merchant: str = self.merchant_key(description)
+        if not merchant or not tags:
+            return
+
+        self.merchant_tags[merchant][tuple(tags)] += 1
+        if merchant in self.merchant_trigrams:
+            return
+
+        self.merchant_trigrams[merchant] = self.trigrams(merchant)
+        for trigram in self.merchant_trigrams[merchant]:
+            self.trigram_merchants[trigram].add(merchant)
+        if self.stale:
+            return
+
+        # Append the merchant's postings against the current (slightly stale) IDF
+        index: int = len(self.merchants)
+        self.merchants.append(merchant)
+        for trigram, weight in self.merchant_weights(merchant).items():
+            indices, weights = self.postings.get(
+                trigram, (np.empty(0, dtype=np.int64), np.empty(0))
+            )
+            self.postings[trigram] = (
+                np.append(indices, index),
+                np.append(weights, weight),
+            )
+
+    def suggest(self, description: str, limit: int = 3) -> List[List[str]]:
+        """Suggest the most frequent tag sets for a description.
+
+        Args:
+            description: Raw transaction description.
+            limit: Maximum number of tag sets to return.
+
+        Returns:
+            Tag sets ordered from most to least likely, possibly empty.
+        """
+
+        merchant: str = self.merchant_key(description)
+        if not merchant:
+            return []
+
+        if merchant not in self.merchant_tags:
+            merchant = self.nearest_merchant(merchant)
+            if not merchant:
+                return []
+
+        return [
+            list(tags) for tags, _ in self.merchant_tags[merchant].most_common(limit)
+        ]
+
+    def refresh(self) -> None:
+        """Precompute trigram IDF values and normalized merchant weight postings.
+
+        Runs once, on the first fuzzy query, so later queries just accumulate
+        dot products over the cached postings.
+        """
+
+        if not self.stale:
+            return
+
+        num_merchants: int = len(self.merchant_trigrams)
+        self.idf = {
+            trigram: math.log((1 + num_merchants) / (1 + len(merchants))) + 1
+            for trigram, merchants in self.trigram_merchants.items()
+        }
+        self.unseen_idf = math.log(1 + num_merchants) + 1
+
+        # Unit-length TF-IDF vectors, stored per trigram as (merchant, weight) arrays
+        self.merchants = list(self.merchant_trigrams)
+        postings: Dict[str, Tuple[List[int], List[float]]] = defaultdict(
+            lambda: ([], [])
+        )
+        for index, merchant in enumerate(self.merchants):
+            for trigram, weight in self.merchant_weights(merchant).items():
+                postings[trigram][0].append(index)
+                postings[trigram][1].append(weight)
+        self.postings = {
+            trigram: (np.array(indices, dtype=np.int64), np.array(weights))
+            for trigram, (indices, weights) in postings.items()
+        }
+
+        self.stale = False
+
+    def merchant_weights(self, merchant: str) -> Dict[str, float]:
+        """Compute a known merchant's unit-length TF-IDF trigram weights."""
+
+        weights: Dict[str, float] = {
+            trigram: count * self.idf.get(trigram, self.unseen_idf)
+            for trigram, count in self.merchant_trigrams[merchant].items()
+        }
+        norm: float = math.sqrt(sum(weight * weight for weight in weights.values()))
+
+        return {trigram: weight / norm for trigram, weight in weights.items()}
+
+    def nearest_merchant(self, merchant: str) -> str:
+        """Find the most similar known merchant by TF-IDF trigram cosine similarity.
+
+        Args:
+            merchant: Normalized merchant key not present in the index.
+
+        Returns:
+            The closest known merchant key, or an empty string if none is similar.
+        """
+
+        self.refresh()
+
+        query: Dict[str, float] = {
+            trigram: count * self.idf.get(trigram, self.unseen_idf)
+            for trigram, count in self.trigrams(merchant).items()
+        }
+        query_norm: float = math.sqrt(sum(weight * weight for weight in query.values()))
+
+        # Score only merchants sharing at least one trigram with the query
+        shared: List[str] = [trigram for trigram in query if trigram in self.postings]
+        if not shared:
+            return ""
+        similarities: np.ndarray = (
+            np.bincount(
+                np.concatenate([self.postings[trigram][0] for trigram in shared]),
+                weights=np.concatenate(
+                    [self.postings[trigram][1] * query[trigram] for trigram in shared]
+                ),
+                minlength=len(self.merchants),
+            )
+            / query_norm
+        )
+
+        best: int = int(np.argmax(similarities))
+        if similarities[best] <= self.MIN_SIMILARITY:
+            return ""
+
+        return self.merchants[best]
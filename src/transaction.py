@@ -11,8 +11,9 @@ class Transaction:
 
     account: str
     date: datetime
-    amount: float
+    amount: int  # integer cents
     description: str
+    transfer_id: int  # shared by both sides of a transfer, -1 otherwise
     tags: List[str]
 
     def __init__(self, df: Any) -> None:
@@ -24,8 +25,9 @@ class Transaction:
 
         self.account = df.account
         self.date = pd.to_datetime(df.date)
-        self.amount = df.amount
+        self.amount = int(df.amount)
         self.description = df.description
+        self.transfer_id = int(getattr(df, "transfer_id", -1))
 
     def set_tags(self, tags: List[str]) -> None:
         """Set tags for this transaction.
@@ -61,7 +63,33 @@ class Transaction:
             Amount formatted with sign and currency (e.g., "+$1,234.56" or "-$500.00").
         """
 
-        return f"{'+' if self.amount > 0 else '-'}${abs(self.amount):,.2f}"
+        return self.format_cents(self.amount)
+
+    @staticmethod
+    def format_cents(cents: int) -> str:
+        """Format an integer cent amount using exact integer math.
+
+        Produces the same string the float-based formatting did, so existing
+        book keys built from formatted amounts keep resolving.
+
+        Args:
+            cents: Amount in integer cents.
+
+        Returns:
+            Amount formatted with sign and currency (e.g., "+$1,234.56" or "-$500.00").
+        """
+
+        dollars, remainder = divmod(abs(cents), 100)
+        return f"{'+' if cents > 0 else '-'}${dollars:,}.{remainder:02d}"
+
+    def is_transfer(self) -> bool:
+        """Check whether this transaction is one side of a transfer between accounts.
+
+        Returns:
+            True if the transaction was matched to a transfer.
+        """
+
+        return self.transfer_id >= 0
 
     def get_description(self) -> str:
         """Get the description for this transaction.
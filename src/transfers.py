@@ -0,0 +1,117 @@
+"""Matching of transfers between accounts so they aren't double counted."""
+
+import numpy as np
+import pandas as pd
+
+
+class TransferMatcher:
+    """Pairs opposite-signed, equal amounts across different accounts.
+
+    Outflows and inflows are each sorted once by (absolute amount, date,
+    account). Matching then makes one vectorized pass per day offset,
+    nearest first: within each run of equal amounts on the two dates, the
+    k-th open outflow is paired with the k-th open inflow, so repeated
+    identical transfers pair by rank instead of contending for the same
+    candidates.
+    """
+
+    WINDOW_DAYS: int = 4  # maximum days between the two sides of a transfer
+
+    @classmethod
+    def match(
+        cls, transactions: pd.DataFrame, window_days: int = WINDOW_DAYS
+    ) -> np.ndarray:
+        """Assign a shared transfer id to each matched pair of transactions.
+
+        Args:
+            transactions: Normalized frame with account, date and amount (cents)
+            window_days: Maximum days between the two sides of a transfer
+
+        Returns:
+            Array aligned with the frame's rows holding the pair's transfer id,
+            or -1 for transactions that aren't part of a transfer
+        """
+
+        amounts: np.ndarray = transactions["amount"].to_numpy(dtype=np.int64)
+        days: np.ndarray = (
+            transactions["date"].to_numpy(dtype="datetime64[D]").astype(np.int64)
+        )
+        accounts: np.ndarray = pd.factorize(transactions["account"])[0]
+        transfer_ids: np.ndarray = np.full(len(transactions), -1, dtype=np.int64)
+        if not len(transactions):
+            return transfer_ids
+        matched: np.ndarray = np.zeros(len(transactions), dtype=bool)
+
+        # Key rows by (absolute amount, date); the padding keeps a key shifted
+        # by up to the window within its amount
+        day_span: int = int(days.max() - days.min()) + 2 * window_days + 1
+        keys: np.ndarray = np.abs(amounts) * day_span + (
+            days - days.min() + window_days
+        )
+
+        # Order outflows by account ascending and inflows descending, so the
+        # front of an equal-amount run pairs different accounts first
+        outflows: np.ndarray = np.flatnonzero(amounts < 0)
+        outflows = outflows[np.lexsort((accounts[outflows], keys[outflows]))]
+        inflows: np.ndarray = np.flatnonzero(amounts > 0)
+        inflows = inflows[np.lexsort((-accounts[inflows], keys[inflows]))]
+
+        # Closest dates first, earlier inflows before later ones at equal gaps
+        offsets: list[int] = [0]
+        for gap in range(1, window_days + 1):
+            offsets += [-gap, gap]
+
+        matched_outflows: list[np.ndarray] = []
+        matched_inflows: list[np.ndarray] = []
+        for offset in offsets:
+            # Align runs from the front, then the rest from the back, so the
+            # accounts left over at either end still find their counterparts
+            for from_end in (False, True):
+                open_outflows: np.ndarray = outflows[~matched[outflows]]
+                open_inflows: np.ndarray = inflows[~matched[inflows]]
+                outflow_keys: np.ndarray = keys[open_outflows] + offset
+                inflow_keys: np.ndarray = keys[open_inflows]
+
+                # Rank each outflow within its run, and find the matching run
+                positions: np.ndarray = np.arange(len(open_outflows))
+                ranks: np.ndarray = (
+                    np.searchsorted(outflow_keys, outflow_keys, side="right")
+                    - 1
+                    - positions
+                    if from_end
+                    else positions
+                    - np.searchsorted(outflow_keys, outflow_keys, side="left")
+                )
+                lows: np.ndarray = np.searchsorted(
+                    inflow_keys, outflow_keys, side="left"
+                )
+                highs: np.ndarray = np.searchsorted(
+                    inflow_keys, outflow_keys, side="right"
+                )
+                paired: np.ndarray = ranks < highs - lows
+                partners: np.ndarray = (
+                    highs - 1 - ranks if from_end else lows + ranks
+                )[paired]
+                pair_outflows: np.ndarray = open_outflows[paired]
+                pair_inflows: np.ndarray = open_inflows[partners]
+
+                # Transfers move money between different accounts
+                different: np.ndarray = (
+                    accounts[pair_outflows] != accounts[pair_inflows]
+                )
+                pair_outflows = pair_outflows[different]
+                pair_inflows = pair_inflows[different]
+                matched[pair_outflows] = True
+                matched[pair_inflows] = True
+                matched_outflows.append(pair_outflows)
+                matched_inflows.append(pair_inflows)
+
+        # Number pairs in row order of their outflows
+        pair_outflows = np.concatenate(matched_outflows)
+        pair_inflows = np.concatenate(matched_inflows)
+        order: np.ndarray = np.argsort(pair_outflows, kind="stable")
+        pair_ids: np.ndarray = np.arange(len(order))
+        transfer_ids[pair_outflows[order]] = pair_ids
+        transfer_ids[pair_inflows[order]] = pair_ids
+
+        return transfer_ids
@@ -1,9 +1,12 @@
+import json
 from argparse import _SubParsersAction
 from pathlib import Path
-from shutil import copy2
 
 import pandas as pd
 
+from backup import BookBackup
+from banker import Banker
+
 
 class Utilities:
     @staticmethod
@@ -41,9 +44,42 @@ class Utilities:
         )
 
         backup_parser = subparsers.add_parser(
-            "backup", help="backup book.json to iCloud Drive"
+            "backup", help="snapshot book.json into a versioned backup directory"
+        )
+        backup_parser.add_argument(
+            "--dest",
+            type=Path,
+            default=BookBackup.BACKUP_PATH,
+            help="directory to store book snapshots in",
+        )
+        backup_parser.add_argument(
+            "--retain",
+            type=int,
+            default=5,
+            help="number of full snapshots (with their deltas) to keep",
+        )
+        backup_parser.set_defaults(
+            func=lambda args: Utilities.backup_book(args.dest, args.retain)
+        )
+
+        restore_parser = subparsers.add_parser(
+            "restore", help="restore book.json from a versioned backup directory"
+        )
+        restore_parser.add_argument(
+            "--dest",
+            type=Path,
+            default=BookBackup.BACKUP_PATH,
+            help="directory holding book snapshots",
+        )
+        restore_parser.add_argument(
+            "--version",
+            type=str,
+            default=None,
+            help="hash of the version to restore (default latest)",
+        )
+        restore_parser.set_defaults(
+            func=lambda args: Utilities.restore_book(args.dest, args.version)
         )
-        backup_parser.set_defaults(func=lambda args: Utilities.backup_book())
 
     @staticmethod
     def combine_csvs(
@@ -122,32 +158,53 @@ class Utilities:
         print(f"csv written to {dst_path} {sort_status}\n")
 
     @staticmethod
-    def backup_book() -> None:
+    def backup_book(
+        backup_path: Path = BookBackup.BACKUP_PATH, retain: int = 5
+    ) -> None:
         """
-        Copy book.json to iCloud Drive folder.
+        Snapshot book.json into a versioned, compressed backup directory.
+
+        Args:
+            backup_path: Directory to store book snapshots in
+            retain: Number of full snapshots (with their deltas) to keep
 
         Raises:
-            FileNotFoundError: If book.json doesn't exist or iCloud Drive is not accessible
+            FileNotFoundError: If book.json doesn't exist
         """
         print()
 
-        # Define paths
-        book_path = Path("book.json")
-        icloud_path = Path.home() / "Library/Mobile Documents/com~apple~CloudDocs"
-        backup_path = icloud_path / "book.json"
+        try:
+            book_hash = BookBackup(backup_path, retain=retain).backup()
+        except Exception as e:
+            print(f"✗ failed to backup book.json: {str(e)}\n")
+            raise
 
-        # Check if book.json exists
-        if not book_path.exists():
-            raise FileNotFoundError(f"book.json not found at: {book_path.absolute()}\n")
+        if book_hash is None:
+            print("book unchanged since last backup\n")
+        else:
+            print(f"book backed up to {backup_path} as {book_hash[:12]}\n")
 
-        # Check if iCloud Drive is accessible
-        if not icloud_path.exists():
-            raise FileNotFoundError(f"iCloud Drive not accessible at: {icloud_path}\n")
+    @staticmethod
+    def restore_book(
+        backup_path: Path = BookBackup.BACKUP_PATH, book_hash: str | None = None
+    ) -> None:
+        """
+        Restore book.json from a versioned backup directory, replacing it atomically.
+
+        Args:
+            backup_path: Directory holding book snapshots
+            book_hash: Hash of the version to restore (default latest)
+
+        Raises:
+            KeyError: If no backup matches the requested version
+        """
+        print()
 
-        # Copy the file
         try:
-            copy2(book_path, backup_path)
-            print("book successfully backed up to iCloud Drive\n")
+            book = BookBackup(backup_path).restore(book_hash)
         except Exception as e:
-            print(f"✗ failed to backup book.json: {str(e)}\n")
+            print(f"✗ failed to restore book.json: {str(e)}\n")
             raise
+
+        BookBackup.write_atomic(Banker.BOOK_PATH, json.dumps(book, indent=2).encode())
+        print(f"book.json restored with {len(book)} tagged transaction(s)\n")
@@ -0,0 +1,38 @@
+"""Tests for parsing currency amounts into cents."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from account import Account
+
+
+def test_parses_signed_and_comma_separated_amounts() -> None:
+    cents = Account.to_cents(pd.Series(["+$1,234.56", "-$1,234.5", "$0.07", "12"]))
+
+    assert cents.tolist() == [123456, -123450, 7, 1200]
+
+
+def test_empty_cells_are_zero_cents() -> None:
+    # ESL splits amounts across credit and debit columns, leaving one empty
+    credit = pd.Series(["25.00", np.nan], dtype=str)
+    debit = pd.Series([np.nan, "-4.10"], dtype=str)
+
+    cents = Account.to_cents(credit) + Account.to_cents(debit)
+
+    assert cents.tolist() == [2500, -410]
+
+
+def test_rounds_extra_decimals_like_float_formatting() -> None:
+    amounts = ["12.345", "-2.675", "0.129"]
+    cents = Account.to_cents(pd.Series(amounts))
+
+    assert cents.tolist() == [
+        round(float(format(float(amount), ".2f")) * 100) for amount in amounts
+    ]
+
+
+@pytest.mark.parametrize("amount", ["-", ".", "-.", "12a", "1.2.3"])
+def test_rejects_amounts_without_digits(amount: str) -> None:
+    with pytest.raises(ValueError):
+        Account.to_cents(pd.Series(["1.00", amount]))
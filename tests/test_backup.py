@@ -0,0 +1,103 @@
+"""Round-trip tests for the book backup engine."""
+
+import json
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from backup import BookBackup
+from utilities import Utilities
+
+
+def write_book(book_path: Path, book: Dict[str, List[str]]) -> None:
+    book_path.write_text(json.dumps(book, indent=2))
+
+
+def test_restore_after_book_reverts(tmp_path: Path) -> None:
+    book_path = tmp_path / "book.json"
+    backup = BookBackup(tmp_path / "backups", book_path=book_path)
+
+    x = {"k1": ["x"]}
+    a = {"k1": ["a"]}
+    b = {"k1": ["a"], "k3": ["c"]}
+
+    hashes: List[str | None] = []
+    for book in (x, a, b, a):
+        write_book(book_path, book)
+        hashes.append(backup.backup())
+
+    assert [version["kind"] for version in backup.read_manifest()] == [
+        "full",
+        "delta",
+        "delta",
+        "delta",
+    ]
+    assert backup.restore(hashes[0]) == x
+    assert backup.restore(hashes[1]) == a
+    assert backup.restore(hashes[2]) == b
+    assert backup.restore() == a
+
+
+def test_unchanged_book_is_skipped(tmp_path: Path) -> None:
+    book_path = tmp_path / "book.json"
+    backup = BookBackup(tmp_path / "backups", book_path=book_path)
+
+    write_book(book_path, {"k1": ["a"]})
+    assert backup.backup() is not None
+    assert backup.backup() is None
+    assert len(backup.read_manifest()) == 1
+
+
+def test_prune_keeps_retained_chains(tmp_path: Path) -> None:
+    book_path = tmp_path / "book.json"
+    backup = BookBackup(
+        tmp_path / "backups", book_path=book_path, full_every=2, retain=2
+    )
+
+    book: Dict[str, List[str]] = {}
+    for i in range(10):
+        book[f"k{i}"] = ["t"]
+        write_book(book_path, book)
+        backup.backup()
+        assert backup.restore() == book
+
+    versions = backup.read_manifest()
+    assert [version["kind"] for version in versions] == [
+        "full",
+        "delta",
+        "full",
+        "delta",
+    ]
+    assert len(list((tmp_path / "backups" / "objects").iterdir())) == 4
+
+
+def test_restore_subcommand_rewrites_book(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    book_path = Path("book.json")
+    backup = BookBackup(Path("backups"), book_path=book_path)
+
+    write_book(book_path, {"k1": ["a"]})
+    book_hash = backup.backup()
+    write_book(book_path, {"k1": ["b"]})
+    backup.backup()
+
+    Utilities.restore_book(Path("backups"), book_hash)
+
+    assert json.loads(book_path.read_text()) == {"k1": ["a"]}
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_empty_or_partial_book_is_rejected(tmp_path: Path) -> None:
+    book_path = tmp_path / "book.json"
+    backup = BookBackup(tmp_path / "backups", book_path=book_path)
+    write_book(book_path, {"k1": ["a"]})
+    backup.backup()
+
+    for contents in ("", '{"k1": ["a'):
+        book_path.write_text(contents)
+        with pytest.raises(ValueError):
+            backup.backup()
+
+    assert len(backup.read_manifest()) == 1
+    assert backup.restore() == {"k1": ["a"]}
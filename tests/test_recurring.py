@@ -0,0 +1,84 @@
+"""Tests for detecting recurring transactions."""
+
+import pandas as pd
+
+from recurring import RecurringDetector
+
+
+def frame(*rows: tuple[str, int, str]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "account": "SoFi Checking",
+            "date": pd.to_datetime([date for date, _, _ in rows]),
+            "amount": [amount for _, amount, _ in rows],
+            "description": [description for _, _, description in rows],
+        }
+    )
+
+
+def monthly(
+    description: str, amounts: list[int], start: str = "2024-01-01"
+) -> list[tuple[str, int, str]]:
+    dates = pd.date_range(start, periods=len(amounts), freq="MS")
+    return [
+        (date.strftime("%Y-%m-%d"), amount, description)
+        for date, amount in zip(dates, amounts)
+    ]
+
+
+def detect(*rows: tuple[str, int, str], as_of: str) -> pd.DataFrame:
+    return RecurringDetector.detect(frame(*rows), as_of=pd.Timestamp(as_of))
+
+
+def test_steady_subscription_is_active() -> None:
+    result = detect(*monthly("NETFLIX.COM 8xx", [-1599] * 8), as_of="2024-09-01")
+
+    assert result[["merchant", "period", "status"]].values.tolist() == [
+        ["netflix", "monthly", "active"]
+    ]
+    assert result["typical_amount"].tolist() == [-1599]
+
+
+def test_recently_started_subscription_is_new() -> None:
+    result = detect(
+        *monthly("Spotify USA", [-1199] * 3, start="2024-06-01"), as_of="2024-08-15"
+    )
+
+    assert result["status"].tolist() == ["new"]
+
+
+def test_old_yearly_charge_is_not_new() -> None:
+    result = detect(
+        ("2022-03-01", -9900, "Costco Membership"),
+        ("2023-03-01", -9900, "Costco Membership"),
+        ("2024-03-01", -9900, "Costco Membership"),
+        as_of="2024-03-01",
+    )
+
+    assert result[["period", "status"]].values.tolist() == [["yearly", "active"]]
+
+
+def test_new_amount_is_price_changed() -> None:
+    result = detect(*monthly("Hulu LLC", [-1799] * 6 + [-1899]), as_of="2024-08-01")
+
+    assert result["status"].tolist() == ["price changed"]
+    assert result["last_amount"].tolist() == [-1899]
+
+
+def test_missed_periods_are_stopped() -> None:
+    result = detect(*monthly("Planet Fitness", [-2500] * 6), as_of="2025-01-01")
+
+    assert result["status"].tolist() == ["stopped"]
+
+
+def test_irregular_merchants_are_not_recurring() -> None:
+    result = detect(
+        ("2024-01-02", -4510, "Shell Oil 5741"),
+        ("2024-01-05", -3890, "Shell Oil 5741"),
+        ("2024-02-20", -5120, "Shell Oil 5741"),
+        ("2024-02-22", -4120, "Shell Oil 5741"),
+        ("2024-04-30", -4730, "Shell Oil 5741"),
+        as_of="2024-05-01",
+    )
+
+    assert result.empty
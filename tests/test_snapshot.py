@@ -0,0 +1,97 @@
+"""Tests for opening and reading session snapshots."""
+
+import json
+import struct
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from snapshot import Snapshot
+
+
+def write_snapshot(snapshot_path: Path) -> pd.DataFrame:
+    transactions = pd.DataFrame(
+        {
+            "account": ["SoFi Checking", "Apple Card", "SoFi Checking"],
+            "date": pd.to_datetime(["2025-01-02", "2025-01-04", "2025-01-03"]),
+            "amount": [-450, -2500, 100010],
+            "description": ["COFFEE", "GROCERIES", "PAYROLL"],
+        }
+    )
+    Snapshot.write(
+        snapshot_path,
+        transactions,
+        ["key 1", "key 2", "key 3"],
+        "fingerprint",
+    )
+    return transactions
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    transactions = write_snapshot(tmp_path / "snapshot.bin")
+
+    snapshot = Snapshot.open(tmp_path / "snapshot.bin", "fingerprint")
+
+    assert snapshot is not None
+    account_frames = snapshot.account_frames()
+    assert sorted(account_frames) == ["Apple Card", "SoFi Checking"]
+    for name, frame in account_frames.items():
+        expected = transactions[transactions["account"] == name]
+        assert frame["amount"].tolist() == expected["amount"].tolist()
+        assert frame["date"].tolist() == expected["date"].tolist()
+        assert frame["description"].tolist() == expected["description"].tolist()
+    assert snapshot.strings("book_key") == ["key 1", "key 3", "key 2"]
+
+
+def test_account_frames_share_mapped_memory(tmp_path: Path) -> None:
+    write_snapshot(tmp_path / "snapshot.bin")
+
+    snapshot = Snapshot.open(tmp_path / "snapshot.bin", "fingerprint")
+
+    assert snapshot is not None
+    for frame in snapshot.account_frames().values():
+        assert np.shares_memory(frame["amount"].to_numpy(), snapshot.columns["amount"])
+        assert np.shares_memory(
+            frame["date"].to_numpy().view("<i8"), snapshot.columns["date"]
+        )
+
+
+def test_stale_fingerprint(tmp_path: Path) -> None:
+    write_snapshot(tmp_path / "snapshot.bin")
+
+    assert Snapshot.open(tmp_path / "snapshot.bin", "other") is None
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        b"",
+        b"not a snapshot",
+        Snapshot.MAGIC + b"\x01\x02\x03",
+        Snapshot.MAGIC + struct.pack("<Q", 5) + b"{oops",
+        Snapshot.MAGIC + struct.pack("<Q", 2) + b"{}",
+    ],
+)
+def test_malformed_file(tmp_path: Path, contents: bytes) -> None:
+    (tmp_path / "snapshot.bin").write_bytes(contents)
+
+    assert Snapshot.open(tmp_path / "snapshot.bin", "fingerprint") is None
+
+
+def test_truncated_sections(tmp_path: Path) -> None:
+    write_snapshot(tmp_path / "snapshot.bin")
+    contents = (tmp_path / "snapshot.bin").read_bytes()
+    (tmp_path / "snapshot.bin").write_bytes(contents[: len(contents) // 2 + 100])
+
+    assert Snapshot.open(tmp_path / "snapshot.bin", "fingerprint") is None
+
+
+def test_header_without_sections(tmp_path: Path) -> None:
+    header = json.dumps({"fingerprint": "fingerprint", "rows": 3}).encode()
+    (tmp_path / "snapshot.bin").write_bytes(
+        Snapshot.MAGIC + struct.pack("<Q", len(header)) + header
+    )
+
+    assert Snapshot.open(tmp_path / "snapshot.bin", "fingerprint") is None
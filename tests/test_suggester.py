@@ -0,0 +1,25 @@
+"""Tests for suggesting tags from previously tagged merchants."""
+
+import numpy as np
+
+from suggester import TagSuggester
+
+
+def test_missing_descriptions_have_no_merchant() -> None:
+    suggester = TagSuggester({})
+    suggester.add(np.nan, ["groceries"])
+
+    assert TagSuggester.merchant_key(np.nan) == ""
+    assert TagSuggester.merchant_key(None) == ""
+    assert suggester.suggest(np.nan) == []
+
+
+def test_merchants_added_after_refresh_are_found() -> None:
+    suggester = TagSuggester({"a on x for $1.00 - Trader Joes 123": ["groceries"]})
+    suggester.refresh()
+
+    suggester.add("Blue Bottle Coffee Oakland", ["coffee"])
+
+    assert not suggester.stale
+    assert suggester.suggest("POS Blue Botle Coffee") == [["coffee"]]
+    assert suggester.suggest("Trader Joe's #55") == [["groceries"]]
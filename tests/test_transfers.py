@@ -0,0 +1,140 @@
+"""Tests for matching transfers between accounts."""
+
+import numpy as np
+import pandas as pd
+
+from transfers import TransferMatcher
+
+
+def frame(*rows: tuple[str, str, int]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "account": [account for account, _, _ in rows],
+            "date": pd.to_datetime([date for _, date, _ in rows]),
+            "amount": [amount for _, _, amount in rows],
+            "description": "",
+        }
+    )
+
+
+def test_matches_transfer_between_accounts() -> None:
+    transfer_ids = TransferMatcher.match(
+        frame(
+            ("SoFi Checking", "2025-01-06", -2500),
+            ("Apple Savings", "2025-01-07", 2500),
+            ("Apple Savings", "2025-01-07", 30),
+        )
+    )
+
+    assert transfer_ids.tolist() == [0, 0, -1]
+
+
+def test_same_account_refund_does_not_block_transfer() -> None:
+    transfer_ids = TransferMatcher.match(
+        frame(
+            ("PNC Checking", "2025-01-01", -10000),
+            ("PNC Checking", "2025-01-01", 10000),
+            ("Chase Freedom Unlimited", "2025-01-02", 10000),
+        )
+    )
+
+    assert transfer_ids.tolist() == [0, -1, 0]
+
+
+def test_intervening_row_does_not_block_transfer() -> None:
+    transfer_ids = TransferMatcher.match(
+        frame(
+            ("PNC Checking", "2025-01-01", -10000),
+            ("PNC Checking", "2025-01-02", 10000),
+            ("PNC Savings", "2025-01-03", 10000),
+        )
+    )
+
+    assert transfer_ids.tolist() == [0, -1, 0]
+
+
+def test_outside_window_is_not_matched() -> None:
+    transfer_ids = TransferMatcher.match(
+        frame(
+            ("SoFi Checking", "2025-01-01", -2500),
+            ("Apple Savings", "2025-01-20", 2500),
+        )
+    )
+
+    assert transfer_ids.tolist() == [-1, -1]
+
+
+def test_pairs_are_one_to_one_and_closest_first() -> None:
+    transfer_ids = TransferMatcher.match(
+        frame(
+            ("SoFi Checking", "2025-01-01", -10000),
+            ("SoFi Checking", "2025-01-03", -10000),
+            ("Apple Savings", "2025-01-03", 10000),
+            ("Apple Savings", "2025-01-04", 10000),
+        )
+    )
+
+    assert transfer_ids[1] == transfer_ids[2] >= 0
+    assert transfer_ids[0] == transfer_ids[3] >= 0
+    assert transfer_ids[0] != transfer_ids[1]
+
+
+def test_same_day_burst_of_identical_transfers() -> None:
+    transfers = 4_000
+    transactions = pd.DataFrame(
+        {
+            "account": ["SoFi Checking"] * transfers + ["Apple Savings"] * transfers,
+            "date": pd.Timestamp("2025-01-06"),
+            "amount": [-1000] * transfers + [1000] * transfers,
+            "description": "",
+        }
+    )
+
+    transfer_ids = TransferMatcher.match(transactions)
+
+    assert (transfer_ids >= 0).all()
+    assert (np.bincount(transfer_ids) == 2).all()
+    assert (transfer_ids[:transfers] == np.arange(transfers)).all()
+
+
+def test_identical_transfers_pair_across_accounts() -> None:
+    transfer_ids = TransferMatcher.match(
+        frame(
+            ("PNC Checking", "2025-01-01", -10000),
+            ("PNC Checking", "2025-01-01", -10000),
+            ("SoFi Checking", "2025-01-01", -10000),
+            ("PNC Checking", "2025-01-01", 10000),
+            ("Apple Savings", "2025-01-01", 10000),
+        )
+    )
+
+    # The PNC inflow can only come from SoFi, leaving Apple for a PNC outflow
+    assert transfer_ids[2] == transfer_ids[3] >= 0
+    assert transfer_ids[4] in transfer_ids[:2]
+    assert transfer_ids[4] >= 0
+
+
+def test_round_amounts_at_scale() -> None:
+    rng = np.random.default_rng(0)
+    rows = 100_000
+    transactions = pd.DataFrame(
+        {
+            "account": rng.choice(["SoFi Checking", "Apple Savings", "PNC"], rows),
+            "date": pd.Timestamp("2020-01-01")
+            + pd.to_timedelta(rng.integers(0, 1800, rows), "D"),
+            "amount": rng.choice([-10000, 10000, -5000, 5000], rows)
+            * rng.integers(1, 20, rows),
+            "description": "",
+        }
+    )
+
+    transfer_ids = TransferMatcher.match(transactions)
+
+    matched = transfer_ids[transfer_ids >= 0]
+    assert (np.bincount(matched) == 2).all()
+    firsts = np.unique(matched, return_index=True)[1]
+    sides = np.flatnonzero(transfer_ids >= 0)[np.argsort(matched, kind="stable")]
+    outflows, inflows = sides[0::2], sides[1::2]
+    assert len(firsts) == len(outflows)
+    amounts = transactions["amount"].to_numpy()
+    assert (amounts[outflows] == -amounts[inflows]).all()